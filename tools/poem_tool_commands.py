@@ -73,6 +73,9 @@ class CommandParser:
         "generate-html": Command(
             ["generate-html", "genhtml"], "Generate HTML from the specified configuration",      (0, None), Handler.generateHtml
         ),
+        "extract-poem": Command(
+            ["extract-poem", "xp"],      "Print a poem from a generated bundle",                 (1, None), Handler.extractPoem
+        ),
     }
 
     def parseCommandArgs():
@@ -6,7 +6,7 @@ import argparse
 import os
 import shutil
 from pathlib import Path
-from website_config import ConfigDatabase, ConfigEntry, PoemEntry, PoemConfig, HtmlPage, generate_index
+from website_config import ConfigDatabase, ConfigEntry, PoemEntry, PoemConfig, HtmlPage, PoemBundle, generate_index, generate_reader
 
 
 def _resolve_config(db, args, name_index=0):
@@ -115,6 +115,7 @@ class Handler:
         parser = argparse.ArgumentParser(prog="generate-html", add_help=False)
         parser.add_argument("config_name", nargs="?", default=None)
         parser.add_argument("-d", "--dest-dir", default="./output")
+        parser.add_argument("-b", "--bundle", action="store_true")
         parsed = parser.parse_args(args)
 
         db = ConfigDatabase()
@@ -138,6 +139,7 @@ class Handler:
         poems = poem_config.getPoems()
 
         pages = []
+        bundled_poems = []
         skipped_copies = 0
         for poem in poems:
             basename = Path(poem.filepath).name
@@ -150,6 +152,7 @@ class Handler:
                     skipped_copies += 1
                 page.write(dest_dir)
                 pages.append(page)
+                bundled_poems.append(poem)
             except ValueError as e:
                 print(f"Warning: skipping '{poem.filepath}': {e}")
 
@@ -158,3 +161,29 @@ class Handler:
 
         generate_index(pages, dest_dir)
         print(f"Generated {len(pages)} poem page(s) and index.html in '{dest_dir}'")
+
+        if parsed.bundle:
+            bundle = PoemBundle(dest_dir)
+            entries = bundle.write(bundled_poems)
+            generate_reader(dest_dir)
+            print(f"Bundled {len(entries)} poem(s) into {PoemBundle.BUNDLE_FILE}, {PoemBundle.INDEX_FILE} and reader.html")
+
+    def extractPoem(args: list):
+        parser = argparse.ArgumentParser(prog="extract-poem", add_help=False)
+        parser.add_argument("identifier")
+        parser.add_argument("-d", "--dest-dir", default="./output")
+        parsed = parser.parse_args(args)
+
+        bundle = PoemBundle(Path(parsed.dest_dir))
+        if not bundle.index_path.is_file() or not bundle.bundle_path.is_file():
+            print(f"Error: no bundle found in '{parsed.dest_dir}'. Use generate-html --bundle to create one.")
+            return
+        try:
+            text = bundle.extract(parsed.identifier)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        if text is None:
+            print(f"Error: poem '{parsed.identifier}' not found in bundle")
+            return
+        return text
@@ -5,8 +5,11 @@ Functions and classes associated with managing website configuration
 """
 
 from pathlib import Path
+import json
+import mmap
 import re
 import os
+import shutil
 import uuid as uuid_module
 
 
@@ -306,3 +309,137 @@ def generate_index(pages, dest_dir: Path):
     out_path = dest_dir / "index.html"
     with open(out_path, 'w') as f:
         f.write(html)
+
+
+class PoemBundle:
+    BUNDLE_FILE = "bundle.txt"
+    INDEX_FILE = "bundle-index.json"
+
+    def __init__(self, dest_dir: Path):
+        self.dest_dir = Path(dest_dir)
+        self.bundle_path = self.dest_dir / PoemBundle.BUNDLE_FILE
+        self.index_path = self.dest_dir / PoemBundle.INDEX_FILE
+
+    def write(self, poems):
+        """
+        Concatenate the poem sources, in the given order, into the bundle file and
+        write the offset index next to it. Sources are streamed straight into the
+        bundle, so no poem is held in memory. Returns the list of index entries.
+        """
+        entries = []
+        with open(self.bundle_path, 'wb') as bundle_file:
+            for poem in poems:
+                offset = bundle_file.tell()
+                with open(poem.filepath, 'rb') as src_file:
+                    shutil.copyfileobj(src_file, bundle_file)
+                entries.append({
+                    "uuid": poem.uuid,
+                    "title": poem.title,
+                    "date": poem.date,
+                    "offset": offset,
+                    "length": bundle_file.tell() - offset,
+                })
+        with open(self.index_path, 'w') as index_file:
+            json.dump(entries, index_file, indent=1)
+        return entries
+
+    def getIndex(self):
+        """Return the list of index entries, or an empty list if there is no index."""
+        if not self.index_path.is_file():
+            return []
+        with open(self.index_path, 'r') as index_file:
+            return json.load(index_file)
+
+    def getEntry(self, identifier: str):
+        """
+        Get the index entry matching uuid or title. If not found, return None
+        """
+        for entry in self.getIndex():
+            if entry["uuid"] == identifier or entry["title"] == identifier:
+                return entry
+        return None
+
+    def extract(self, identifier: str):
+        """
+        Return the text of the poem matching uuid or title, read out of the bundle
+        through mmap. Returns None if the poem is not in the index.
+        """
+        entry = self.getEntry(identifier)
+        if entry is None:
+            return None
+        if entry["length"] == 0:
+            # mmap can't map an empty bundle, and there is nothing to read anyway
+            return ""
+        with open(self.bundle_path, 'rb') as bundle_file:
+            with mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                start = entry["offset"]
+                end = start + entry["length"]
+                if end > len(mapped):
+                    raise ValueError(f"index entry for '{identifier}' runs past the end of {self.bundle_path}")
+                return mapped[start:end].decode('utf-8')
+
+
+def generate_reader(dest_dir: Path):
+    """
+    Generate a reader.html page that loads the bundle index and fetches a single
+    poem out of the bundle with an HTTP Range request.
+    """
+    html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <link rel="stylesheet" href="/styles.css">
+    <title>Poems</title>
+</head>
+<body>
+    <table id="index"></table>
+    <div id="poem"></div>
+    <script>
+        const decoder = new TextDecoder('utf-8');
+
+        function showPoem(entry) {{
+            if (entry.length === 0) {{
+                document.getElementById('poem').innerText = '';
+                return;
+            }}
+            const end = entry.offset + entry.length - 1;
+            fetch('{PoemBundle.BUNDLE_FILE}', {{ headers: {{ 'Range': `bytes=${{entry.offset}}-${{end}}` }} }})
+            .then(response => response.arrayBuffer().then(buffer => {{
+                // servers that ignore Range send the whole bundle; slice it ourselves
+                if (response.status !== 206) {{
+                    buffer = buffer.slice(entry.offset, end + 1);
+                }}
+                document.getElementById('poem').innerText = decoder.decode(buffer);
+            }}))
+            .catch(error => console.error('Error loading poem:', error));
+        }}
+
+        fetch('{PoemBundle.INDEX_FILE}')
+        .then(response => response.json())
+        .then(entries => {{
+            const table = document.getElementById('index');
+            for (const entry of entries) {{
+                const row = table.insertRow();
+                const link = document.createElement('a');
+                link.href = `#${{entry.uuid}}`;
+                link.innerText = entry.title.replaceAll('-', ' ');
+                row.insertCell().appendChild(link);
+                row.insertCell().innerText = entry.date;
+            }}
+            const load = () => {{
+                const entry = entries.find(e => e.uuid === location.hash.slice(1));
+                if (entry) {{
+                    showPoem(entry);
+                }}
+            }};
+            window.addEventListener('hashchange', load);
+            load();
+        }})
+        .catch(error => console.error('Error loading bundle index:', error));
+    </script>
+</body>
+</html>"""
+
+    out_path = dest_dir / "reader.html"
+    with open(out_path, 'w') as f:
+        f.write(html)